@@ -5,9 +5,12 @@ the :rst:dir:`automodapi` and :rst:dir:`automodsumm` directives.
 __all__ = ["AutomodsummEntry", "AutomodsummRenderer", "GenDocsFromAutomodsumm"]
 
 import os
+import pickle
 import re
+import sys
+import time
 
-from jinja2 import TemplateNotFound
+from jinja2 import Template, TemplateNotFound
 from sphinx.ext.autodoc.mock import mock
 from sphinx.ext.autosummary import get_rst_suffix, import_by_name, import_ivar_by_name
 from sphinx.ext.autosummary.generate import (
@@ -18,7 +21,7 @@ from sphinx.ext.autosummary.generate import (
 from sphinx.locale import __
 from sphinx.util import logging
 from sphinx.util.osutil import ensuredir
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Set, Tuple, Union
 
 from ..utils import templates_dir
 
@@ -76,6 +79,56 @@ class AutomodsummRenderer(AutosummaryRenderer):
 
         super().__init__(app)
 
+        # resolved templates, keyed by the requested template name
+        self._template_cache: Dict[str, Template] = {}
+
+        # names of all templates the loader can find, or None if the loader
+        # is not able to list them
+        self._available_templates = self._list_templates()
+
+        # last modification time of any template file
+        self.templates_mtime = self._templates_mtime()
+
+    def _list_templates(self) -> Union[Set[str], None]:
+        """
+        Names of all the templates available to the template loader, or
+        `None` if any of the loaders can not list their templates.
+        """
+        # sphinx's SphinxTemplateLoader does not implement list_templates, but
+        # the file system loaders it wraps do
+        loaders = getattr(self.env.loader, "loaders", [self.env.loader])
+
+        available = set()
+        try:
+            for loader in loaders:
+                available.update(loader.list_templates())
+        except TypeError:
+            return None
+
+        return available
+
+    def _templates_mtime(self) -> Union[float, None]:
+        """
+        Last modification time of any file in the template search paths,
+        or `None` if any of the loaders does not search the file system.
+        Templates may extend or include each other, so a change to any
+        template file can change any rendered stub file.
+        """
+        loaders = getattr(self.env.loader, "loaders", [self.env.loader])
+
+        mtime = 0.0
+        for loader in loaders:
+            searchpath = getattr(loader, "searchpath", None)
+            if searchpath is None:
+                return None
+
+            for directory in searchpath:
+                for root, _, files in os.walk(directory):
+                    for file in files:
+                        mtime = max(mtime, os.stat(os.path.join(root, file)).st_mtime)
+
+        return mtime
+
     def render(self, template_name: str, context: Dict) -> str:
         """
         Render a template file.  The render will first search for the template in
@@ -97,17 +150,27 @@ class AutomodsummRenderer(AutosummaryRenderer):
             # if does not have '.rst' then objtype likely given for template_name
             template_name += ".rst"
 
-        template = None
+        template = self._template_cache.get(template_name)
+        if template is not None:
+            return template.render(context)
+
         for name in [template_name, "base.rst"]:
             for _path in ["", "automodsumm/", "autosummary/"]:
-                try:
-                    template = self.env.get_template(_path + name)
-                    return template.render(context)
-                except TemplateNotFound:
-                    pass
+                candidate = _path + name
+                if self._available_templates is not None:
+                    if candidate not in self._available_templates:
+                        continue
+                    template = self.env.get_template(candidate)
+                else:
+                    try:
+                        template = self.env.get_template(candidate)
+                    except TemplateNotFound:
+                        continue
+
+                self._template_cache[template_name] = template
+                return template.render(context)
 
-        if template is None:
-            raise TemplateNotFound
+        raise TemplateNotFound(template_name)
 
 
 class GenDocsFromAutomodsumm:
@@ -140,6 +203,27 @@ class GenDocsFromAutomodsumm:
     builds.
     """
 
+    stub_cache_filename = ".automodsumm_cache.pkl"
+    """
+    Name of the file, placed in each stub file directory, that records when
+    and from what each stub file was generated.  This allows unchanged stub
+    files to be skipped on incremental builds.
+
+    A stub file is regenerated when the Sphinx configuration file, a
+    template file, the source file containing the directive, or the source
+    file of the module defining the object, or of any class in the object's
+    (or its parent class') method resolution order, has changed since it was
+    generated.  Any other change that affects a stub file, for example a
+    member attached to a class from a different module, is not detected
+    and requires the stub files to be removed (e.g. with ``make clean-api``).
+    """
+
+    _stub_cache_format = 2
+    """
+    Version of the stub file cache layout, caches with a different version
+    are discarded.
+    """
+
     def __call__(self, app: "Sphinx"):
         """
         Scan through source files, check for the :rst:dir:`automodsumm` and
@@ -160,9 +244,9 @@ class GenDocsFromAutomodsumm:
         if genfiles is True:
             env = app.builder.env
             genfiles = [
-                env.doc2path(x, base=None)
-                for x in env.found_docs
-                if os.path.isfile(env.doc2path(x))
+                relpath
+                for relpath in (env.doc2path(x, base=None) for x in env.found_docs)
+                if os.path.isfile(os.path.join(env.srcdir, relpath))
             ]
         elif genfiles is False:
             pass
@@ -173,12 +257,15 @@ class GenDocsFromAutomodsumm:
                 for genfile in genfiles
             ]
 
-            for entry in genfiles[:]:
-                if not os.path.isfile(os.path.join(app.srcdir, entry)):
+            found_genfiles = []
+            for entry in genfiles:
+                if os.path.isfile(os.path.join(app.srcdir, entry)):
+                    found_genfiles.append(entry)
+                else:
                     self.logger.warning(
                         __(f"automodsumm_generate: file not found: {entry}")
                     )
-                    genfiles.remove(entry)
+            genfiles = found_genfiles
 
         if not genfiles:
             return
@@ -254,6 +341,9 @@ class GenDocsFromAutomodsumm:
         _info = self.logger.info
         _warn = self.logger.warning
 
+        # stub files generated from sources older than this are up-to-date
+        start_time = time.time()
+
         showed_sources = list(sorted(source_filenames))
         _info(
             __(f"[automodsumm] generating stub files for {len(showed_sources)} sources")
@@ -269,12 +359,31 @@ class GenDocsFromAutomodsumm:
 
         template = AutomodsummRenderer(app)
 
-        # read
-        items = self.find_in_files(source_filenames)
+        # read, keeping track of the last modification time of the source
+        # file(s) defining each entry
+        items = []
+        source_mtimes = {}  # type: Dict[AutomodsummEntry, float]
+        for source_filename in source_filenames:
+            found = self.find_in_files([source_filename])
+            mtime = os.stat(source_filename).st_mtime
+            for entry in found:
+                source_mtimes[entry] = max(mtime, source_mtimes.get(entry, 0.0))
+            items.extend(found)
 
         # keep track of new files
         new_files = []
 
+        # sizes of the files already present in each output directory, so
+        # each directory is scanned once instead of stat-ing every stub file
+        existing_sizes = {}  # type: Dict[str, Dict[str, int]]
+        existing_mtimes = {}  # type: Dict[str, Dict[str, float]]
+
+        # stub file caches for each output directory
+        stub_caches = {}  # type: Dict[str, Dict[str, tuple]]
+
+        # content of the stub files to be written, keyed by filename
+        pending_writes = {}  # type: Dict[str, str]
+
         if app:
             filename_map = app.config.autosummary_filename_map
         else:
@@ -288,7 +397,52 @@ class GenDocsFromAutomodsumm:
                 continue
 
             path = output_dir or os.path.abspath(entry.path)
-            ensuredir(path)
+            if path not in existing_sizes:
+                ensuredir(path)
+                with os.scandir(path) as it:
+                    stats = {de.name: de.stat() for de in it if de.is_file()}
+                existing_sizes[path] = {
+                    fname: stat.st_size for fname, stat in stats.items()
+                }
+                existing_mtimes[path] = {
+                    fname: stat.st_mtime for fname, stat in stats.items()
+                }
+                stub_caches[path] = self._load_stub_cache(path)
+
+            # skip the import and content generation if the stub file is
+            # known to be up-to-date
+            stub_cache = stub_caches[path]
+            if self._stub_is_current(
+                entry,
+                stub_cache.get(entry.name),
+                existing_sizes[path],
+                source_mtimes[entry],
+                template.templates_mtime,
+            ):
+                continue
+
+            # without a stub file cache entry fall back to comparing the
+            # modification time of an existing stub file with that of the
+            # same sources the cache tracks, which does not require
+            # importing the object
+            basename = filename_map.get(entry.name, entry.name) + suffix
+            stub_mtime = existing_mtimes[path].get(basename)
+            if stub_mtime is not None and entry.name not in stub_cache:
+                if not overwrite:
+                    continue
+
+                dependencies = self._stub_is_newer_than_sources(
+                    entry, stub_mtime, source_mtimes[entry], template.templates_mtime
+                )
+                if dependencies is not None:
+                    stub_cache[entry.name] = (
+                        stub_mtime,
+                        entry.template,
+                        basename,
+                        existing_sizes[path][basename],
+                        dependencies,
+                    )
+                    continue
 
             try:
                 name, obj, parent, modname = import_by_name(entry.name)
@@ -319,22 +473,49 @@ class GenDocsFromAutomodsumm:
                 modname,
                 qualname,
             )
+            dependencies = self._object_source_files(obj, parent, modname)
+
+            basename = filename_map.get(name, name) + suffix
+            filename = os.path.join(path, basename)
+            size = len(content.replace("\n", os.linesep).encode(encoding))
+            old_size = existing_sizes[path].get(basename)
+            if old_size is not None:
+                if not overwrite:
+                    continue
 
-            filename = os.path.join(path, filename_map.get(name, name) + suffix)
-            if os.path.isfile(filename):
-                with open(filename, encoding=encoding) as f:
-                    old_content = f.read()
+                # only read the existing file when the sizes match, otherwise
+                # the content has certainly changed
+                if size == old_size:
+                    with open(filename, encoding=encoding) as f:
+                        old_content = f.read()
+
+                    if content == old_content:
+                        stub_cache[entry.name] = (
+                            start_time,
+                            entry.template,
+                            basename,
+                            size,
+                            dependencies,
+                        )
+                        continue
 
-                if content == old_content:
-                    continue
-                elif overwrite:  # content has changed
-                    with open(filename, "w", encoding=encoding) as f:
-                        f.write(content)
-                    new_files.append(filename)
-            else:
-                with open(filename, "w", encoding=encoding) as f:
-                    f.write(content)
+            if filename not in pending_writes:
                 new_files.append(filename)
+            pending_writes[filename] = content
+            stub_cache[entry.name] = (
+                start_time,
+                entry.template,
+                basename,
+                size,
+                dependencies,
+            )
+
+        for filename, content in pending_writes.items():
+            with open(filename, "w", encoding=encoding) as f:
+                f.write(content)
+
+        for path, stub_cache in stub_caches.items():
+            self._save_stub_cache(path, stub_cache)
 
         # descend recursively to new files
         if new_files:
@@ -347,6 +528,166 @@ class GenDocsFromAutomodsumm:
                 overwrite=overwrite,
             )
 
+    @staticmethod
+    def _object_source_files(obj: Any, parent: Any, modname: str) -> Tuple[str, ...]:
+        """
+        Source files the stub file of ``obj`` depends on: the file of module
+        ``modname`` defining the object, and the module files of every class
+        in the method resolution order of ``obj`` and of its ``parent``, if
+        they are classes.  A class stub file lists inherited members, so it
+        changes when a base class in another module does.
+        """
+        modnames = {modname}
+        for item in (obj, parent):
+            if isinstance(item, type):
+                modnames.update(cls.__module__ for cls in item.__mro__)
+
+        files = (getattr(sys.modules.get(mod), "__file__", None) for mod in modnames)
+        return tuple(sorted(file for file in files if file is not None))
+
+    def _conf_mtime(self) -> Union[float, None]:
+        """
+        Last modification time of the Sphinx configuration file, or `None`
+        if it can not be determined.
+        """
+        if self.app is None or self.app.confdir is None:
+            return None
+
+        try:
+            return os.stat(os.path.join(self.app.confdir, "conf.py")).st_mtime
+        except OSError:
+            return None
+
+    def _load_stub_cache(self, path: str) -> Dict[str, tuple]:
+        """
+        Load the stub file cache stored in directory ``path``.  An empty
+        cache is returned if there is none, it can not be read, or the
+        Sphinx configuration has changed since it was written.
+
+        The cache maps an entry name to a tuple of the time the stub file
+        was generated, the template name, the stub file name, the stub file
+        size, and the source files the stub file depends on.
+        """
+        try:
+            with open(os.path.join(path, self.stub_cache_filename), "rb") as f:
+                cache = pickle.load(f)  # noqa: S301
+        except Exception:  # noqa: BLE001
+            return {}
+
+        if (
+            cache.get("format") != self._stub_cache_format
+            or cache.get("conf_mtime") != self._conf_mtime()
+        ):
+            return {}
+
+        return cache.get("entries", {})
+
+    def _save_stub_cache(self, path: str, entries: Dict[str, tuple]) -> None:
+        """
+        Atomically write the stub file cache ``entries`` to directory
+        ``path``.
+        """
+        cache = {
+            "format": self._stub_cache_format,
+            "conf_mtime": self._conf_mtime(),
+            "entries": entries,
+        }
+        cache_file = os.path.join(path, self.stub_cache_filename)
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_file, "wb") as f:
+                pickle.dump(cache, f)
+            os.replace(tmp_file, cache_file)
+        except OSError as err:
+            self.logger.warning(
+                __(f"[automodsumm] unable to write stub file cache {cache_file}: {err}")
+            )
+
+    def _stub_is_newer_than_sources(
+        self,
+        entry: AutomodsummEntry,
+        stub_mtime: float,
+        source_mtime: float,
+        templates_mtime: Union[float, None],
+    ) -> Union[Tuple[str, ...], None]:
+        """
+        Check if an existing stub file for ``entry``, last modified at
+        ``stub_mtime``, is newer than the Sphinx configuration file, the
+        template files, the source file defining the entry, and the source
+        files the stub file depends on (see `_object_source_files`).  The
+        object is looked up in the already imported modules, without
+        importing anything.
+
+        Returns the source files the stub file depends on if the stub file
+        is newer than all of them, otherwise `None`.
+        """
+        conf_mtime = self._conf_mtime()
+        if (
+            conf_mtime is None
+            or templates_mtime is None
+            or stub_mtime <= max(source_mtime, conf_mtime, templates_mtime)
+        ):
+            return None
+
+        # the module is the longest prefix of the entry name that has been
+        # imported, the remainder is looked up as attributes
+        parts = entry.name.split(".")
+        for ii in range(len(parts), 0, -1):
+            modname = ".".join(parts[:ii])
+            if modname in sys.modules:
+                break
+        else:
+            return None
+
+        obj = sys.modules[modname]
+        parent = None
+        for attr in parts[ii:]:
+            parent = obj
+            try:
+                obj = getattr(obj, attr)
+            except Exception:  # noqa: BLE001
+                return None
+
+        dependencies = self._object_source_files(obj, parent, modname)
+        if not self._files_older_than(dependencies, stub_mtime):
+            return None
+
+        return dependencies
+
+    @staticmethod
+    def _files_older_than(files: Tuple[str, ...], time_: float) -> bool:
+        """`True` if all ``files`` were last modified before ``time_``."""
+        try:
+            return all(os.stat(file).st_mtime < time_ for file in files)
+        except OSError:
+            return False
+
+    def _stub_is_current(
+        self,
+        entry: AutomodsummEntry,
+        cached: Union[tuple, None],
+        existing_sizes: Dict[str, int],
+        source_mtime: float,
+        templates_mtime: Union[float, None],
+    ) -> bool:
+        """
+        `True` if the stub file for ``entry`` recorded in the stub file cache
+        is still on disk with its recorded size, and was generated after the
+        template files, the source file defining the entry, and the source
+        files the stub file depends on were last modified.
+        """
+        if cached is None or templates_mtime is None:
+            return False
+
+        gen_time, template, basename, size, dependencies = cached
+        if template != entry.template or existing_sizes.get(basename) != size:
+            return False
+
+        if max(source_mtime, templates_mtime) >= gen_time:
+            return False
+
+        return self._files_older_than(dependencies, gen_time)
+
     def find_in_files(self, filenames: List[str]) -> List[AutomodsummEntry]:
         """
         Search files for the :rst:dir:`automodapi` and :rst:dir:`automodsumm`
@@ -366,8 +707,13 @@ class GenDocsFromAutomodsumm:
         documented = []  # type: List[AutomodsummEntry]
         for filename in filenames:
             with open(filename, encoding="utf-8", errors="ignore") as f:
-                lines = f.read().splitlines()
-                documented.extend(self.find_in_lines(lines, filename=filename))
+                text = f.read()
+
+            # skip files that can not contain either directive
+            if "automod" not in text:
+                continue
+
+            documented.extend(self.find_in_lines(text.splitlines(), filename=filename))
         return documented
 
     def find_in_lines(
@@ -412,13 +758,19 @@ class GenDocsFromAutomodsumm:
         last_line = False
         nlines = len(lines)
 
+        # bind the regex search methods locally to avoid repeated lookups
+        search_option = self._re["option"].search
+        search_automodsumm = self._re["automodsumm"].search
+        search_automodapi = self._re["automodapi"].search
+        search_currentmodule = self._re["currentmodule"].search
+
         for ii, line in enumerate(lines):
             if ii == nlines - 1:
                 last_line = True
 
             # looking for option `   :option: option_args`
             if in_automodapi_directive:
-                match = self._re["option"].search(line)
+                match = search_option(line)
                 if match is not None:
                     option_name = match.group(2)
                     option_args = match.group(3)
@@ -440,8 +792,13 @@ class GenDocsFromAutomodsumm:
                 if in_automodapi_directive:
                     continue
 
+            # every directive searched for below contains "::", so any other
+            # line can be skipped unless objects still need to be gathered
+            if not gather_objs and "::" not in line:
+                continue
+
             # looking for `.. automodsumm:: <modname>`
-            match = self._re["automodsumm"].search(line)
+            match = search_automodsumm(line) if "automodsumm::" in line else None
             if match is not None:
                 in_automodapi_directive = True
                 # base_indent = match.group(1)
@@ -462,7 +819,7 @@ class GenDocsFromAutomodsumm:
                     continue
 
             # looking for `.. automodapi:: <modname>`
-            match = self._re["automodapi"].search(line)
+            match = search_automodapi(line) if "automodapi::" in line else None
             if match is not None:
                 in_automodapi_directive = True
                 # base_indent = match.group(1)
@@ -482,7 +839,7 @@ class GenDocsFromAutomodsumm:
                     continue
 
             # looking for `.. py:currentmodule:: <current_module>`
-            match = self._re["currentmodule"].search(line)
+            match = search_currentmodule(line) if "module::" in line else None
             if match is not None:
                 current_module = match.group(3)
                 continue
@@ -0,0 +1,124 @@
+"""
+Tests for the incremental stub file generation of
+`plasmapy_sphinx.automodsumm.generate`.
+
+These tests are not collected by default since the ``docs`` directory is
+excluded from the test paths, run them with
+``pytest docs/plasmapy_sphinx/tests``.
+"""
+import os
+import pickle
+import pytest
+import sys
+import time
+
+from plasmapy_sphinx.automodsumm.generate import GenDocsFromAutomodsumm
+from sphinx.application import Sphinx
+
+modules = {
+    "mod_a.py": "def func_a():\n    pass\n",
+    "mod_b.py": (
+        "def func_b():\n    pass\n\n\nclass ClassB:\n    def method(self):\n"
+        "        pass\n"
+    ),
+}
+
+stubs = {
+    "autogen_pkg.mod_a.func_a",
+    "autogen_pkg.mod_b.func_b",
+    "autogen_pkg.mod_b.ClassB",
+}
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """
+    A Sphinx project documenting the package ``autogen_pkg`` with the
+    :rst:dir:`automodsumm` directive, with all its files last modified
+    in the past.
+    """
+    src = tmp_path / "src"
+    pkg = tmp_path / "autogen_pkg"
+    src.mkdir()
+    pkg.mkdir()
+    (src / "_templates").mkdir()
+
+    (pkg / "__init__.py").write_text("")
+    for filename, content in modules.items():
+        (pkg / filename).write_text(content)
+
+    (src / "conf.py").write_text(
+        'extensions = ["plasmapy_sphinx"]\ntemplates_path = ["_templates"]\n'
+    )
+    (src / "_templates" / "unused.rst").write_text("")
+    (src / "index.rst").write_text(
+        "Test\n====\n\n"
+        ".. automodsumm:: autogen_pkg.mod_a\n   :toctree: api\n\n"
+        ".. automodsumm:: autogen_pkg.mod_b\n   :toctree: api\n"
+    )
+
+    past = time.time() - 100
+    for file in tmp_path.rglob("*"):
+        os.utime(file, (past, past))
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield tmp_path
+
+    for modname in [mod for mod in sys.modules if mod.startswith("autogen_pkg")]:
+        del sys.modules[modname]
+
+
+def build(path):
+    """
+    Build the Sphinx project in ``path`` and return the time each stub file
+    was last generated, as recorded in the stub file cache.
+    """
+    src = path / "src"
+    app = Sphinx(
+        srcdir=str(src),
+        confdir=str(src),
+        outdir=str(path / "build"),
+        doctreedir=str(path / "build" / ".doctrees"),
+        buildername="dummy",
+        status=None,
+        warning=None,
+        freshenv=True,
+    )
+    app.build()
+
+    cache_file = src / "api" / GenDocsFromAutomodsumm.stub_cache_filename
+    with cache_file.open("rb") as f:
+        entries = pickle.load(f)["entries"]  # noqa: S301
+
+    return {name: cached[0] for name, cached in entries.items()}
+
+
+@pytest.mark.parametrize(
+    "touched, regenerated",
+    [
+        (None, set()),
+        ("autogen_pkg/mod_a.py", {"autogen_pkg.mod_a.func_a"}),
+        (
+            "autogen_pkg/mod_b.py",
+            {"autogen_pkg.mod_b.func_b", "autogen_pkg.mod_b.ClassB"},
+        ),
+        ("src/_templates/unused.rst", stubs),
+        ("src/conf.py", stubs),
+    ],
+)
+def test_incremental_stub_generation(project, touched, regenerated):
+    """
+    Test that building a project a second time only regenerates the stub
+    files affected by the modified file.  Any template file can change
+    any stub file, and the stub file cache is discarded when the Sphinx
+    configuration file changes.
+    """
+    first = build(project)
+    assert set(first) == stubs
+
+    if touched is not None:
+        os.utime(project / touched)
+
+    second = build(project)
+    assert set(second) == stubs
+    assert {name for name in stubs if second[name] != first[name]} == regenerated
@@ -10,11 +10,13 @@ __all__ = ["Tracker", "synthetic_radiograph"]
 import astropy.constants as const
 import astropy.units as u
 import collections
+import math
 import numpy as np
 import sys
 import warnings
 
 from collections.abc import Iterable
+from numba import njit, prange
 from tqdm import tqdm
 from typing import Union
 
@@ -22,7 +24,7 @@ from plasmapy import particles
 from plasmapy.formulary.mathematics import rot_a_to_b
 from plasmapy.particles import Particle
 from plasmapy.plasma.grids import AbstractGrid
-from plasmapy.simulation.particle_integrators import boris_push
+from plasmapy.simulation.particle_integrators import _boris_push_kernel
 
 
 def _coerce_to_cartesian_si(pos):
@@ -71,6 +73,22 @@ def _coerce_to_cartesian_si(pos):
     return pos_out
 
 
+@njit(parallel=True, cache=True)
+def _add_finite(total, values, scale):
+    """
+    Add the [nparticles, nfields] ``values`` array, multiplied by a
+    conversion factor ``scale`` for each field, to the [nfields, nparticles]
+    ``total`` array in place.  Any non-finite entries (points off the grid)
+    are treated as zero.
+    """
+    nparticles, nfields = values.shape
+    for i in prange(nparticles):
+        for j in range(nfields):
+            val = values[i, j]
+            if math.isfinite(val):
+                total[j, i] += scale[j] * val
+
+
 class Tracker:
     r"""
     Represents a charged particle radiography experiment with simulated or
@@ -145,6 +163,11 @@ class Tracker:
         # so that it isn't continuously called later
         self.grids_arr = [grid.grid.to(u.m).value for grid in self.grids]
 
+        # The resolution of each grid in meters, used to limit the timestep
+        self._grid_resolutions_m = np.array(
+            [grid.grid_resolution.to_value(u.m) for grid in self.grids]
+        )
+
         self.verbose = verbose
 
         # A list of wire meshes added to the grid with add_wire_mesh
@@ -217,8 +240,13 @@ class Tracker:
             grid.require_quantities(req_quantities, replace_with_zeros=True)
 
             for rq in req_quantities:
+                values = grid[rq].value
+
                 # Check that there are no infinite values
-                if not np.isfinite(grid[rq].value).all():
+                # NaN and infinite values propagate through the sum, so the
+                # elementwise check is only needed if the sum is not finite
+                # (which can also happen if the sum overflows)
+                if not np.isfinite(values.sum()) and not np.isfinite(values).all():
                     raise ValueError(
                         f"Input arrays must be finite: {rq} contains "
                         "either NaN or infinite values."
@@ -226,27 +254,17 @@ class Tracker:
 
                 # Check that the max values on the edges of the arrays are
                 # small relative to the maximum values on that grid
-                #
-                # Array must be dimensionless to re-assemble it into an array
-                # of max values like this
-                arr = np.abs(grid[rq]).value
-                edge_max = np.max(
-                    np.array(
-                        [
-                            np.max(a)
-                            for a in (
-                                arr[0, :, :],
-                                arr[-1, :, :],
-                                arr[:, 0, :],
-                                arr[:, -1, :],
-                                arr[:, :, 0],
-                                arr[:, :, -1],
-                            )
-                        ]
-                    )
+                arr = np.abs(values)
+                edge_max = max(
+                    arr[0, :, :].max(),
+                    arr[-1, :, :].max(),
+                    arr[:, 0, :].max(),
+                    arr[:, -1, :].max(),
+                    arr[:, :, 0].max(),
+                    arr[:, :, -1].max(),
                 )
 
-                if edge_max > 1e-3 * np.max(arr):
+                if edge_max > 1e-3 * arr.max():
                     unit = grid.recognized_quantities[rq].unit
                     warnings.warn(
                         "Fields should go to zero at edges of grid to avoid "
@@ -257,6 +275,18 @@ class Tracker:
                         RuntimeWarning,
                     )
 
+        # Conversion factors from the units of the fields stored on each grid
+        # to SI units, so interpolated fields can be used without units
+        self._field_si_scale = [
+            np.array(
+                [
+                    grid[rq].unit.to(grid.recognized_quantities[rq].unit)
+                    for rq in req_quantities
+                ]
+            )
+            for grid in self.grids
+        ]
+
     @property
     def num_grids(self):
         return len(self.grids)
@@ -309,6 +339,9 @@ class Tracker:
     # Define some constants so they don't get constantly re-evaluated
     _c = const.c.si.value
 
+    # Number of push steps between updates of the progress meter
+    _progress_interval = 50
+
     # *************************************************************************
     # Create mesh
     # *************************************************************************
@@ -759,44 +792,32 @@ class Tracker:
         Calculate the appropriate dt for each grid based on a number of
         considerations
         including the local grid resolution (ds) and the gyroperiod of the
-        particles in the current fields.
+        particles in the current fields (given in SI units).
         """
         # If dt was explicitly set, skip the rest of this function
         if self.dt.size == 1:
             return self.dt
 
-        # candidate timesteps includes one per grid (based on the grid resolution)
-        # plus additional candidates based on the field at each particle
-        candidates = np.ones([self.nparticles_grid, self.num_grids + 1]) * np.inf
-
         # Compute the timestep indicated by the grid resolution
-        ds = np.array([grid.grid_resolution.to(u.m).value for grid in self.grids])
-        gridstep = 0.5 * (ds / self.vmax)
+        gridstep = 0.5 * (self._grid_resolutions_m / self.vmax)
 
-        # Wherever a particle is on a grid, include that grid's gridstep
-        # in the list of candidate timesteps
-        for i, _grid in enumerate(self.grids):  # noqa: B007
-            candidates[:, i] = np.where(self.on_grid[:, i] > 0, gridstep[i], np.inf)
+        # candidate timesteps includes one per grid (based on the grid resolution)
+        # wherever a particle is on that grid, shape [nparticles, ngrids]
+        candidates = np.where(self.on_grid > 0, gridstep[np.newaxis, :], np.inf)
 
         # If not, compute a number of possible timesteps
         # Compute the cyclotron gyroperiod
-        Bmag = np.max(np.sqrt(Bx**2 + By**2 + Bz**2)).to(u.T).value
+        Bmag = np.sqrt((Bx * Bx + By * By + Bz * Bz).max())
         # Compute the gyroperiod
-        if Bmag == 0:
-            gyroperiod = np.inf
-        else:
-            gyroperiod = 2 * np.pi * self.m / (self.q * np.max(Bmag))
-
-        candidates[:, self.num_grids] = gyroperiod / 12
+        gyroperiod = np.inf if Bmag == 0 else 2 * np.pi * self.m / (self.q * Bmag)
 
         # TODO: introduce a minimum timestep based on electric fields too!
 
-        # Enforce limits on dt
-        candidates = np.clip(candidates, self.dt[0], self.dt[1])
-
-        # dt is the min of all the candidates for each particle
-        # a separate dt is returned for each particle
-        dt = np.min(candidates, axis=-1)
+        # dt is the min of all the candidates for each particle (including
+        # the gyroperiod candidate shared by all particles), limited to the
+        # allowed range. A separate dt is returned for each particle
+        dt = np.minimum(np.min(candidates, axis=-1), gyroperiod / 12)
+        dt = np.clip(dt, self.dt[0], self.dt[1])
 
         # dt should never actually be infinite, so replace any infinities
         # with the largest gridstep
@@ -904,28 +925,19 @@ class Tracker:
         Boris algorithm
         """
         # Get a list of positions (input for interpolator)
-        pos = self.x[self.grid_ind, :] * u.m
-
-        # Update the list of particles on and off the grid
-        # shape [nparticles, ngrids]
-        self.on_grid = np.array([grid.on_grid(pos) for grid in self.grids]).T
-
-        # entered_grid is zero at the end if a particle has never
-        # entered any grid
-        self.entered_grid += np.sum(self.on_grid, axis=-1)
-
-        Ex = np.zeros(self.nparticles_grid) * u.V / u.m
-        Ey = np.zeros(self.nparticles_grid) * u.V / u.m
-        Ez = np.zeros(self.nparticles_grid) * u.V / u.m
-        Bx = np.zeros(self.nparticles_grid) * u.T
-        By = np.zeros(self.nparticles_grid) * u.T
-        Bz = np.zeros(self.nparticles_grid) * u.T
-        for grid in self.grids:
+        # Wrapping without a copy is cheaper than multiplying by the unit,
+        # and the interpolators then strip the unit without a copy either
+        pos = u.Quantity(self.x[self.grid_ind, :], u.m, copy=False)
+
+        # Reset the total E and B fields at each particle
+        fields = self._fields
+        fields.fill(0.0)
+        for i, (grid, si_scale) in enumerate(zip(self.grids, self._field_si_scale)):
             # Estimate the E and B fields for each particle
             # Note that this interpolation step is BY FAR the slowest part of the push
             # loop. Any speed improvements will have to come from here.
             if self.field_weighting == "volume averaged":
-                _Ex, _Ey, _Ez, _Bx, _By, _Bz = grid.volume_averaged_interpolator(
+                vals = grid._volume_averaged_values(
                     pos,
                     "E_x",
                     "E_y",
@@ -936,7 +948,7 @@ class Tracker:
                     persistent=True,
                 )
             elif self.field_weighting == "nearest neighbor":
-                _Ex, _Ey, _Ez, _Bx, _By, _Bz = grid.nearest_neighbor_interpolator(
+                vals = grid._nearest_neighbor_values(
                     pos,
                     "E_x",
                     "E_y",
@@ -947,49 +959,31 @@ class Tracker:
                     persistent=True,
                 )
 
-            # Interpret any NaN values (points off the grid) as zero
-            # Do this before adding to the totals, because 0 + nan = nan
-            _Ex = np.nan_to_num(_Ex, nan=0.0 * u.V / u.m)
-            _Ey = np.nan_to_num(_Ey, nan=0.0 * u.V / u.m)
-            _Ez = np.nan_to_num(_Ez, nan=0.0 * u.V / u.m)
-            _Bx = np.nan_to_num(_Bx, nan=0.0 * u.T)
-            _By = np.nan_to_num(_By, nan=0.0 * u.T)
-            _Bz = np.nan_to_num(_Bz, nan=0.0 * u.T)
-
-            # Add the values interpolated for this grid to the totals
-            Ex += _Ex
-            Ey += _Ey
-            Ez += _Ez
-            Bx += _Bx
-            By += _By
-            Bz += _Bz
-
-        # Create arrays of E and B as required by push algorithm
-        E = np.array(
-            [Ex.to(u.V / u.m).value, Ey.to(u.V / u.m).value, Ez.to(u.V / u.m).value]
-        )
-        E = np.moveaxis(E, 0, -1)
-        B = np.array([Bx.to(u.T).value, By.to(u.T).value, Bz.to(u.T).value])
-        B = np.moveaxis(B, 0, -1)
+            # Update the list of particles on and off the grid
+            # The interpolators return NaN exactly for the points off the grid
+            # shape [nparticles, ngrids]
+            np.isfinite(vals[:, 0], out=self.on_grid[:, i])
+
+            # Add the values interpolated for this grid to the totals,
+            # interpreting any NaN values (points off the grid) as zero
+            _add_finite(fields, vals, si_scale)
+
+        # entered_grid is zero at the end if a particle has never
+        # entered any grid
+        self.entered_grid += np.sum(self.on_grid, axis=-1)
 
         # Calculate the adaptive timestep from the fields currently experienced
         # by the particles
         # If user sets dt explicitly, that's handled in _adaptive_dt
-        dt = self._adaptive_dt(Ex, Ey, Ez, Bx, By, Bz)
+        dt = self._adaptive_dt(*fields)
 
         # TODO: Test v/c and implement relativistic Boris push when required
         # vc = np.max(v)/_c
 
-        # If dt is not a scalar, make sure it can be multiplied by an
-        # [nparticles, 3] shape field array
-        if dt.size > 1:
-            dt = dt[:, np.newaxis]
-
-        x = self.x[self.grid_ind, :]
-        v = self.v[self.grid_ind, :]
-        boris_push(x, v, B, E, self.q, self.m, dt)
-        self.x[self.grid_ind, :] = x
-        self.v[self.grid_ind, :] = v
+        # Push the tracked particles in place
+        _boris_push_kernel(
+            self.x, self.v, self.grid_ind, fields, self.q, self.m, np.atleast_1d(dt)
+        )
 
     @property
     def on_any_grid(self):
@@ -997,7 +991,7 @@ class Tracker:
         Binary array for each particle indicating whether it is currently
         on ANY grid.
         """
-        return np.sum(self.on_grid, axis=-1) > 0
+        return self.on_grid.any(axis=-1)
 
     def _stop_condition(self):
         r"""
@@ -1011,12 +1005,16 @@ class Tracker:
         # How many of the particles have entered the grid
         self.fract_entered = np.sum(self.num_entered) / self.nparticles_grid
 
+        # Number of particles currently on any grid
+        # Stored so the progress meter in run() can reuse it
+        self._n_on_grid = np.count_nonzero(self.on_any_grid)
+
         # Of the particles that have entered the grid, how many are currently
         # on the grid?
         # if/else avoids dividing by zero
         if np.sum(self.num_entered) > 0:
             # Normalize to the number that have entered a grid
-            still_on = np.sum(self.on_any_grid) / np.sum(self.num_entered)
+            still_on = self._n_on_grid / np.sum(self.num_entered)
         else:
             still_on = 0.0
 
@@ -1107,7 +1105,7 @@ class Tracker:
 
         # Calculate the maximum velocity
         # Used for determining the grid crossing maximum timestep
-        self.vmax = np.max(np.linalg.norm(self.v, axis=-1))
+        self.vmax = np.sqrt(np.einsum("ij,ij->i", self.v, self.v).max())
 
         # Determine which particles should be tracked
         # This array holds the indices of all particles that WILL hit the grid
@@ -1123,6 +1121,11 @@ class Tracker:
         # Entered grid -> non-zero if particle EVER entered a grid
         self.entered_grid = np.zeros([self.nparticles_grid])
 
+        # Buffer of the total E and B fields at each tracked particle, in SI
+        # units, reused by every push
+        # shape [6, nparticles] with rows [Ex, Ey, Ez, Bx, By, Bz]
+        self._fields = np.zeros([6, self.nparticles_grid])
+
         # Generate a null distribution of points (the result in the absence of
         # any fields) for statistical comparison
         self.x0 = self._coast_to_plane(self.detector, self.det_hdir, self.det_vdir)
@@ -1144,13 +1147,16 @@ class Tracker:
 
         # Push the particles until the stop condition is satisfied
         # (no more particles on the simulation grid)
+        # The progress meter is only updated every _progress_interval steps
+        nsteps = 0
         while not self._stop_condition():
-            n_on_grid = np.sum(self.on_any_grid)
-            pbar.n = n_on_grid
-            pbar.last_print_n = n_on_grid
-            pbar.update()
+            if nsteps % self._progress_interval == 0:
+                pbar.n = self._n_on_grid
+                pbar.last_print_n = self._n_on_grid
+                pbar.update()
 
             self._push()
+            nsteps += 1
         pbar.close()
 
         # Remove particles that will never reach the detector
@@ -5,12 +5,12 @@ from plasmapy.particles._special_particles import particle_zoo
 from plasmapy.particles.exceptions import InvalidParticleError
 
 
-@pytest.fixture(params=sorted(particle_zoo.everything))
+@pytest.fixture(scope="session", params=sorted(particle_zoo.everything))
 def particle(request):
     return Particle(request.param)
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def opposite(particle):
     try:
         opposite_particle = ~particle
@@ -23,6 +23,7 @@ def opposite(particle):
 
 
 @pytest.fixture(
+    scope="session",
     params=sorted(
         [
             ("e-", "e+"),
@@ -34,7 +35,7 @@ def opposite(particle):
             ("nu_mu", "anti_nu_mu"),
             ("nu_tau", "anti_nu_tau"),
         ]
-    )
+    ),
 )
 def particle_antiparticle_pair(request):
     return [Particle(p) for p in request.param]
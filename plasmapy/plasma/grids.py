@@ -901,13 +901,79 @@ class AbstractGrid(ABC):
         """
         return [self.ds[arg].attrs["unit"] for arg in self._interp_args]
 
+    def _attach_interp_units(self, vals):
+        r"""
+        Split a dimensionless ``[..., nargs]`` array of interpolated values
+        into `~astropy.units.Quantity` arrays with the units of each
+        interpolated quantity.
+        """
+        output = [
+            vals[..., index] * unit for index, unit in enumerate(self._interp_units)
+        ]
+        return output[0] if len(output) == 1 else tuple(output)
+
+    def _interpolated_values(self, interpolator, pos, args, persistent):
+        r"""
+        Call the public ``interpolator`` for the quantities ``args`` and
+        stack the `~astropy.units.Quantity` values it returns into a single
+        dimensionless ``[n, nargs]`` array, in the units stored on the grid.
+
+        The values at positions off the grid are set to NaN even if the
+        interpolator does not do so, since callers use the NaN values to
+        find the positions on the grid.
+        """
+        if not isinstance(pos, u.Quantity):
+            pos = pos * self.unit
+        off_grid = ~self.on_grid(np.reshape(pos, (-1, 3)))
+
+        vals = interpolator(pos, *args, persistent=persistent)
+        if len(args) == 1:
+            vals = (vals,)
+        vals = np.stack(
+            [val.to_value(self[arg].unit) for val, arg in zip(vals, args)], axis=-1
+        )
+        vals[off_grid] = np.nan
+
+        return vals
+
+    def _nearest_neighbor_values(
+        self, pos: Union[np.ndarray, u.Quantity], *args, persistent=False
+    ):
+        r"""
+        Same as `nearest_neighbor_interpolator`, but returns a single
+        dimensionless ``[n, nargs]`` array of the interpolated values in
+        the units stored on the grid.
+
+        Subclasses should override this to avoid creating the intermediate
+        `~astropy.units.Quantity` arrays.
+        """
+        return self._interpolated_values(
+            self.nearest_neighbor_interpolator, pos, args, persistent
+        )
+
+    def _volume_averaged_values(
+        self, pos: Union[np.ndarray, u.Quantity], *args, persistent=False
+    ):
+        r"""
+        Same as ``volume_averaged_interpolator``, for grids that implement
+        it, but returns a single dimensionless ``[n, nargs]`` array of the
+        interpolated values in the units stored on the grid.
+
+        Subclasses should override this to avoid creating the intermediate
+        `~astropy.units.Quantity` arrays.
+        """
+        return self._interpolated_values(
+            self.volume_averaged_interpolator, pos, args, persistent
+        )
+
     @abstractmethod
     def nearest_neighbor_interpolator(
         self, pos: Union[np.ndarray, u.Quantity], *args, persistent=False
     ):
         r"""
         Interpolate values on the grid using a nearest-neighbor scheme with
-        no higher-order weighting.
+        no higher-order weighting.  The values at positions off the grid
+        are NaN.
 
         Parameters
         ----------
@@ -979,7 +1045,7 @@ class AbstractGrid(ABC):
 
         # Condition pos
         if isinstance(pos, u.Quantity):
-            pos = pos.to(u.m).value
+            pos = pos.to_value(u.m)
         elif self.unit != u.m:
             pos *= self.unit.si.scale
         # If a single point was given, add empty dimension
@@ -1099,7 +1165,17 @@ class CartesianGrid(AbstractGrid):
         self, pos: Union[np.ndarray, u.Quantity], *args, persistent=False
     ):
         r""" """  # noqa: D419
+        vals = self._nearest_neighbor_values(pos, *args, persistent=persistent)
+        return self._attach_interp_units(vals)
 
+    def _nearest_neighbor_values(
+        self, pos: Union[np.ndarray, u.Quantity], *args, persistent=False
+    ):
+        r"""
+        Same as `nearest_neighbor_interpolator`, but returns a single
+        dimensionless ``[n, nargs]`` array of the interpolated values in
+        the units stored on the grid (see ``_interp_units``).
+        """
         # Shared setup
         pos, args, persistent = self._persistent_interpolator_setup(
             pos, args, persistent
@@ -1127,19 +1203,15 @@ class CartesianGrid(AbstractGrid):
         # Replace values of off-grid particles with NaN
         vals[mask_particle_off, :] = np.nan
 
-        # Split output array into arrays with units
-        # Apply units to output arrays
-        output = [
-            vals[..., index] * self._interp_units[index] for index, _ in enumerate(args)
-        ]
-        return output[0] if len(output) == 1 else tuple(output)
+        return vals
 
     def volume_averaged_interpolator(
         self, pos: Union[np.ndarray, u.Quantity], *args, persistent=False
     ):
         r"""
         Interpolate values on the grid using a volume-averaged scheme with
-        no higher-order weighting.
+        no higher-order weighting.  The values at positions off the grid
+        are NaN.
 
         Parameters
         ----------
@@ -1176,13 +1248,23 @@ class CartesianGrid(AbstractGrid):
         This implementation of this algorithm assumes that the grid is uniformly
         spaced and Cartesian.
         """
+        weighted_ave = self._volume_averaged_values(pos, *args, persistent=persistent)
+        return self._attach_interp_units(weighted_ave)
+
+    def _volume_averaged_values(
+        self, pos: Union[np.ndarray, u.Quantity], *args, persistent=False
+    ):
+        r"""
+        Same as `volume_averaged_interpolator`, but returns a single
+        dimensionless ``[n, nargs]`` array of the interpolated values in
+        the units stored on the grid (see ``_interp_units``).
+        """
         # Shared setup
         pos, args, persistent = self._persistent_interpolator_setup(
             pos, args, persistent
         )
 
         nparticles = pos.shape[0]
-        nargs = len(args)
 
         # Load grid attributes (so this isn't repeated)
         ax0, ax1, ax2 = self._ax0_si, self._ax1_si, self._ax2_si
@@ -1295,13 +1377,7 @@ class CartesianGrid(AbstractGrid):
         weighted_ave = np.sum(bounding_cell_weights[..., None] * vals, axis=1)
         weighted_ave[mask_particle_off, :] = np.nan
 
-        # Split output array into arrays with units
-        # Apply units to output arrays
-        output = [
-            weighted_ave[..., arg] * self._interp_units[arg] for arg in range(nargs)
-        ]
-
-        return output[0] if len(output) == 1 else tuple(output)
+        return weighted_ave
 
 
 class NonUniformCartesianGrid(AbstractGrid):
@@ -1397,6 +1473,17 @@ class NonUniformCartesianGrid(AbstractGrid):
         self, pos: Union[np.ndarray, u.Quantity], *args, persistent=False
     ):
         r""" """  # noqa: D419
+        vals = self._nearest_neighbor_values(pos, *args, persistent=persistent)
+        return self._attach_interp_units(vals)
+
+    def _nearest_neighbor_values(
+        self, pos: Union[np.ndarray, u.Quantity], *args, persistent=False
+    ):
+        r"""
+        Same as `nearest_neighbor_interpolator`, but returns a single
+        dimensionless ``[n, nargs]`` array of the interpolated values in
+        the units stored on the grid (see ``_interp_units``).
+        """
         # Shared setup
         pos, args, persistent = self._persistent_interpolator_setup(
             pos, args, persistent
@@ -1428,6 +1515,4 @@ class NonUniformCartesianGrid(AbstractGrid):
 
         vals[mask_particle_off] = np.nan
 
-        output = [vals[:, arg] * self._interp_units[arg] for arg in range(len(args))]
-
-        return output[0] if len(output) == 1 else tuple(output)
+        return vals
@@ -582,6 +582,47 @@ def test_uniform_cartesian_NN_interp_persistence(uniform_cartesian_grid):
     assert np.allclose(pout, pos[:, [0, 2]].T, atol=0.6 * uniform_cartesian_grid.dax0)
 
 
+@pytest.mark.parametrize(
+    "method", ["_nearest_neighbor_values", "_volume_averaged_values"]
+)
+@pytest.mark.parametrize("quantities", [["x"], ["x", "rho"]])
+def test_AbstractGrid_default_interpolated_values(
+    method, quantities, uniform_cartesian_grid
+):
+    """
+    Test that the default `AbstractGrid` implementations of the
+    dimensionless interpolators, which call the public interpolators,
+    agree with the `CartesianGrid` implementations.
+    """
+    pos = np.array([[0.1, -0.3, 0.1], [-0.5, 0, -0.6], [2, 0, 0]]) * u.cm
+
+    expected = getattr(uniform_cartesian_grid, method)(pos, *quantities)
+    vals = getattr(grids.AbstractGrid, method)(uniform_cartesian_grid, pos, *quantities)
+
+    assert vals.shape == (3, len(quantities))
+    assert np.allclose(vals, expected, equal_nan=True)
+
+
+def test_AbstractGrid_default_interpolated_values_off_grid(
+    monkeypatch, uniform_cartesian_grid
+):
+    """
+    Test that the default dimensionless interpolators return NaN off the
+    grid even if the public interpolator does not.
+    """
+    pos = np.array([[0.1, -0.3, 0.1], [2, 0, 0]]) * u.cm
+
+    monkeypatch.setattr(
+        uniform_cartesian_grid,
+        "nearest_neighbor_interpolator",
+        lambda pos, *args, **kwargs: np.zeros(pos.shape[0]) * u.cm,
+    )
+    vals = grids.AbstractGrid._nearest_neighbor_values(uniform_cartesian_grid, pos, "x")
+
+    assert vals[0, 0] == 0
+    assert np.isnan(vals[1, 0])
+
+
 # **********************************************************************
 # Non-uniform Cartesian grid tests
 # **********************************************************************
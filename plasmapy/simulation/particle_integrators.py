@@ -11,6 +11,204 @@ __all__ = ["boris_push"]
 
 import numpy as np
 
+from numba import njit, prange
+
+
+@njit(inline="always")
+def _boris_velocity(vx, vy, vz, ex, ey, ez, bx, by, bz, hqmdt):
+    """
+    Explicit Boris update (see `boris_push`) of the velocity of a single
+    particle, for use within numba-compiled particle pushers.
+
+    ``(vx, vy, vz)`` is the velocity, ``(ex, ey, ez)`` and ``(bx, by, bz)``
+    the electric and magnetic fields at the particle, all in SI units, and
+    ``hqmdt`` is ``0.5 * dt * q / m``.  Returns the updated velocity, which
+    the caller should use to advance the particle position.
+
+    Numba's on-disk cache only checks the source file of a cached function,
+    not of the functions inlined into it, so the pushers using this function
+    are defined in this module.
+    """
+    # half of the electric impulse
+    ex *= hqmdt
+    ey *= hqmdt
+    ez *= hqmdt
+    vx += ex
+    vy += ey
+    vz += ez
+
+    # rotate to add magnetic field
+    tx = hqmdt * bx
+    ty = hqmdt * by
+    tz = hqmdt * bz
+    norm = 2.0 / (1.0 + tx * tx + ty * ty + tz * tz)
+    sx = norm * tx
+    sy = norm * ty
+    sz = norm * tz
+
+    px = vx + vy * tz - vz * ty
+    py = vy + vz * tx - vx * tz
+    pz = vz + vx * ty - vy * tx
+
+    vx += py * sz - pz * sy
+    vy += pz * sx - px * sz
+    vz += px * sy - py * sx
+
+    # second half of the electric impulse
+    return vx + ex, vy + ey, vz + ez
+
+
+@njit(inline="always")
+def _cell_weight(axis, p):
+    """
+    Index of the cell of the sorted grid ``axis`` containing ``p``, and the
+    fractional position of ``p`` within that cell.
+    """
+    i = np.searchsorted(axis, p, side="right") - 1
+    i = min(max(i, 0), axis.size - 2)
+    return i, (p - axis[i]) / (axis[i + 1] - axis[i])
+
+
+@njit(inline="always")
+def _check_domain(x, y, z, ax, ay, az):
+    """
+    Raise a `ValueError` if any particle is not within the grid with axes
+    ``ax``, ``ay``, and ``az``, including particles at NaN positions.
+    """
+    for i in range(x.size):
+        if not (
+            ax[0] <= x[i] <= ax[-1]
+            and ay[0] <= y[i] <= ay[-1]
+            and az[0] <= z[i] <= az[-1]
+        ):
+            raise ValueError("A particle is outside of the plasma domain.")
+
+
+@njit(inline="always")
+def _interpolate(x, y, z, ax, ay, az, fields):
+    """
+    Trilinearly interpolate the ``[Ex, Ey, Ez, Bx, By, Bz]`` fields at the
+    point ``(x, y, z)``, with ``fields`` as for `_gather_boris_step`.
+    """
+    ix, wx = _cell_weight(ax, x)
+    iy, wy = _cell_weight(ay, y)
+    iz, wz = _cell_weight(az, z)
+    ex = ey = ez = bx = by = bz = 0.0
+    for dx in range(2):
+        fx = wx if dx else 1.0 - wx
+        for dy in range(2):
+            fy = wy if dy else 1.0 - wy
+            for dz in range(2):
+                w = fx * fy * (wz if dz else 1.0 - wz)
+                cell = fields[ix + dx, iy + dy, iz + dz]
+                ex += w * cell[0]
+                ey += w * cell[1]
+                ez += w * cell[2]
+                bx += w * cell[3]
+                by += w * cell[4]
+                bz += w * cell[5]
+    return ex, ey, ez, bx, by, bz
+
+
+# fastmath is not used, since the domain check must also reject NaN positions
+@njit(cache=True)
+def _gather_fields(x, y, z, ax, ay, az, fields, out):
+    """
+    Interpolate the fields at each particle into the (n, 6) array ``out``,
+    with the arguments as for `_gather_boris_step`.
+    """
+    _check_domain(x, y, z, ax, ay, az)
+    for i in range(x.size):
+        ex, ey, ez, bx, by, bz = _interpolate(x[i], y[i], z[i], ax, ay, az, fields)
+        out[i, 0] = ex
+        out[i, 1] = ey
+        out[i, 2] = ez
+        out[i, 3] = bx
+        out[i, 4] = by
+        out[i, 5] = bz
+
+
+# fastmath is not used, since the domain check must also reject NaN positions
+@njit(cache=True)
+def _gather_boris_step(x, y, z, vx, vy, vz, ax, ay, az, fields, qm, dt):
+    """
+    Advance particles in place by one timestep using the explicit Boris
+    algorithm (see `boris_push`), for
+    `~plasmapy.simulation.particletracker.ParticleTracker`.
+
+    The fields at each particle are linearly interpolated from ``fields``,
+    a (nx, ny, nz, 6) array of ``[Ex, Ey, Ez, Bx, By, Bz]`` given on the grid
+    with axes ``ax``, ``ay``, and ``az``, as part of the same loop that
+    pushes the particle.  The positions and velocities are given as
+    separate 1D arrays for each component.  All values are in SI units, and
+    ``qm`` is the charge-to-mass ratio of the particles.
+    """
+    _check_domain(x, y, z, ax, ay, az)
+
+    hqmdt = 0.5 * dt * qm
+    for i in range(x.size):
+        ex, ey, ez, bx, by, bz = _interpolate(x[i], y[i], z[i], ax, ay, az, fields)
+
+        vx[i], vy[i], vz[i] = _boris_velocity(
+            vx[i], vy[i], vz[i], ex, ey, ez, bx, by, bz, hqmdt
+        )
+
+        x[i] += vx[i] * dt
+        y[i] += vy[i] * dt
+        z[i] += vz[i] * dt
+
+
+@njit(inline="always")
+def _boris_step(x, v, i, fields, k, qm, dt):
+    """
+    Advance particle ``i`` of ``x`` and ``v`` in place by a timestep ``dt``
+    using the fields in column ``k`` of ``fields``.  ``qm`` is the
+    charge-to-mass ratio.
+    """
+    vx, vy, vz = _boris_velocity(
+        v[i, 0],
+        v[i, 1],
+        v[i, 2],
+        fields[0, k],
+        fields[1, k],
+        fields[2, k],
+        fields[3, k],
+        fields[4, k],
+        fields[5, k],
+        0.5 * dt * qm,
+    )
+
+    v[i, 0] = vx
+    v[i, 1] = vy
+    v[i, 2] = vz
+    x[i, 0] += vx * dt
+    x[i, 1] += vy * dt
+    x[i, 2] += vz * dt
+
+
+@njit(parallel=True, cache=True)
+def _boris_push_kernel(x, v, ind, fields, q, m, dt):
+    """
+    Advance the particles ``x[ind]`` and ``v[ind]`` in place using the
+    explicit Boris algorithm (see `boris_push`), for
+    `~plasmapy.diagnostics.charged_particle_radiography.synthetic_radiography.Tracker`.
+
+    ``fields`` is a [6, ind.size] array of the ``[Ex, Ey, Ez, Bx, By, Bz]``
+    fields (in SI units) at each particle being pushed, and ``dt`` is either
+    a single timestep or one timestep per particle.
+    """
+    qm = q / m
+
+    # branch once on the kind of timestep, rather than for every particle,
+    # so a fixed timestep is a loop invariant
+    if dt.size == 1:
+        dt0 = dt[0]
+        for k in prange(ind.size):
+            _boris_step(x, v, ind[k], fields, k, qm, dt0)
+    else:
+        for k in prange(ind.size):
+            _boris_step(x, v, ind[k], fields, k, qm, dt[k])
+
 
 def boris_push(x, v, B, E, q, m, dt, inplace: bool = True):
     r"""
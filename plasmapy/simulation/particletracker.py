@@ -5,12 +5,15 @@ __all__ = ["ParticleTracker"]
 
 import astropy.units as u
 import numpy as np
-import scipy.interpolate as interp
 
 from astropy import constants
 
 from plasmapy.particles import atomic
 from plasmapy.simulation import particle_integrators
+from plasmapy.simulation.particle_integrators import (
+    _gather_boris_step,
+    _gather_fields,
+)
 from plasmapy.utils.decorators import validate_quantities
 
 
@@ -44,18 +47,6 @@ class ParticleTracker:
 
     Attributes
     ----------
-    x : `astropy.units.Quantity`
-        Current position. Shape (n, 3).
-
-    v : `astropy.units.Quantity`
-        Current velocity. Shape (n, 3).
-
-    position_history : `astropy.units.Quantity`
-        History of position.  Shape (nt, n, 3).
-
-    velocity_history : `astropy.units.Quantity`
-        History of velocity. Shape (nt, n, 3).
-
     q : `astropy.units.Quantity`
         Charge of particle.
 
@@ -106,41 +97,87 @@ class ParticleTracker:
 
         self.dt = dt
         self.NT = int(nt)
+
+        # unitless values used by the integrator
+        self._qm_si = (self.q / self.m).si.value
+        self._dt_si = dt.si.value
         self.t = np.arange(nt) * dt
 
-        self.x = np.zeros((n_particles, 3), dtype=float) * u.m
-        self.v = np.zeros((n_particles, 3), dtype=float) * (u.m / u.s)
+        # positions and velocities are stored as one contiguous row per
+        # component (in SI units), see the x and v properties
+        self._x = np.zeros((3, self.N), dtype=float)
+        self._v = np.zeros((3, self.N), dtype=float)
         self.name = particle_type
 
-        self.position_history = np.zeros((self.NT, *self.x.shape), dtype=float) * u.m
-        self.velocity_history = np.zeros((self.NT, *self.v.shape), dtype=float) * (
-            u.m / u.s
-        )
-        # create intermediate array of dimension (nx,ny,nz,3) in order to allow
-        # interpolation on non-equal spatial domain dimensions
+        # unitless (SI) history buffers, see the position_history and
+        # velocity_history properties
+        self._position_history = np.zeros((self.NT, self.N, 3), dtype=float)
+        self._velocity_history = np.zeros((self.NT, self.N, 3), dtype=float)
+
+        self.integrator = self._all_integrators[integrator]
+
+        # grid axes and an (nx, ny, nz, 6) array of the [Ex, Ey, Ez, Bx, By, Bz]
+        # fields on the grid, in SI units, for interpolation within the integrator
         _B = np.moveaxis(self.plasma.magnetic_field.si.value, 0, -1)
         _E = np.moveaxis(self.plasma.electric_field.si.value, 0, -1)
+        fields = np.concatenate((_E, _B), axis=-1)
+
+        # the integrator needs strictly increasing axes, so descending axes
+        # are flipped along with the fields
+        axes = []
+        for dim, (name, axis) in enumerate(
+            zip("xyz", (self.plasma.x, self.plasma.y, self.plasma.z))
+        ):
+            axis = axis.si.value
+            if axis.size < 2:
+                raise ValueError(
+                    f"The {name} axis of the plasma must have at least two "
+                    f"points to interpolate the fields, but it has {axis.size}."
+                )
+            if axis[0] > axis[-1]:
+                axis = axis[::-1]
+                fields = np.flip(fields, axis=dim)
+            if np.any(np.diff(axis) <= 0):
+                raise ValueError(
+                    f"The {name} axis of the plasma must be strictly "
+                    "increasing or decreasing."
+                )
+            axes.append(np.ascontiguousarray(axis))
+
+        self._grid_axes_si = tuple(axes)
+        self._fields_si = np.ascontiguousarray(fields)
+
+        # the [Ex, Ey, Ez, Bx, By, Bz] fields at each particle, for
+        # integrators other than boris_push
+        self._particle_fields = np.zeros((self.N, 6), dtype=float)
 
-        self.integrator = self._all_integrators[integrator]
+    @property
+    def x(self):
+        """Current position. Shape (n, 3)."""
+        return u.Quantity(self._x.T, u.m, copy=False)
 
-        self._B_interpolator = interp.RegularGridInterpolator(
-            (self.plasma.x.si.value, self.plasma.y.si.value, self.plasma.z.si.value),
-            _B,
-            method="linear",
-            bounds_error=True,
-        )
+    @x.setter
+    def x(self, value):
+        self._x[...] = value.to_value(u.m).T
 
-        self._E_interpolator = interp.RegularGridInterpolator(
-            (self.plasma.x.si.value, self.plasma.y.si.value, self.plasma.z.si.value),
-            _E,
-            method="linear",
-            bounds_error=True,
-        )
+    @property
+    def v(self):
+        """Current velocity. Shape (n, 3)."""
+        return u.Quantity(self._v.T, u.m / u.s, copy=False)
 
-    def _interpolate_fields(self):
-        interpolated_b = self._B_interpolator(self.x.si.value) * u.T
-        interpolated_e = self._E_interpolator(self.x.si.value) * u.V / u.m
-        return interpolated_b, interpolated_e
+    @v.setter
+    def v(self, value):
+        self._v[...] = value.to_value(u.m / u.s).T
+
+    @property
+    def position_history(self):
+        """History of position.  Shape (nt, n, 3)."""
+        return u.Quantity(self._position_history, u.m, copy=False)
+
+    @property
+    def velocity_history(self):
+        """History of velocity.  Shape (nt, n, 3)."""
+        return u.Quantity(self._velocity_history, u.m / u.s, copy=False)
 
     @property
     def kinetic_energy_history(self):
@@ -152,7 +189,8 @@ class ParticleTracker:
         `~astropy.units.Quantity`
             Array of kinetic energies, shape (nt, n).
         """
-        return (self.velocity_history**2).sum(axis=-1) * self.eff_m / 2
+        v = self._velocity_history
+        return np.einsum("ijk,ijk->ij", v, v) * (self.eff_m / 2 * (u.m / u.s) ** 2)
 
     def boris_push(self, init=False):
         r"""
@@ -181,27 +219,36 @@ class ParticleTracker:
         This ends up causing the magnetic field action to be properly
         "centered" in time, and the algorithm conserves energy.
         """
-        b, e = self._interpolate_fields()
-
         if init:
-            self.integrator(
-                self.x.copy(),
-                self.v,
-                b,
-                e,
-                self.q,
-                self.m,
-                -0.5 * self.dt,
-            )  # we don't want to change position here
+            # we don't want to change position here
+            x = self._x.copy()
+            dt = -0.5 * self._dt_si
+        else:
+            x = self._x
+            dt = self._dt_si
+
+        if self.integrator is particle_integrators.boris_push:
+            # interpolate the fields within the same loop that pushes
+            # the particles, in unitless SI values
+            _gather_boris_step(
+                *x,
+                *self._v,
+                *self._grid_axes_si,
+                self._fields_si,
+                self._qm_si,
+                dt,
+            )
         else:
+            fields = self._particle_fields
+            _gather_fields(*x, *self._grid_axes_si, self._fields_si, fields)
             self.integrator(
-                self.x,
-                self.v,
-                b,
-                e,
-                self.q,
-                self.m,
-                self.dt,
+                x.T,
+                self._v.T,
+                fields[:, 3:],
+                fields[:, :3],
+                self.q.si.value,
+                self.m.si.value,
+                dt,
             )
 
     def run(self):
@@ -209,12 +256,12 @@ class ParticleTracker:
         Run a simulation instance.
         """
         self.boris_push(init=True)
-        self.position_history[0] = self.x
-        self.velocity_history[0] = self.v
+        self._position_history[0] = self._x.T
+        self._velocity_history[0] = self._v.T
         for i in range(1, self.NT):
             self.boris_push()
-            self.position_history[i] = self.x
-            self.velocity_history[i] = self.v
+            self._position_history[i] = self._x.T
+            self._velocity_history[i] = self._v.T
 
     def __repr__(self, *args, **kwargs):
         return (